@@ -2,16 +2,18 @@
 from datetime import timedelta
 import logging
 import asyncio
+import time
 from http import HTTPStatus
 
 from aiohttp import ClientResponseError
 
+from homeassistant.components.alarm_control_panel import AlarmControlPanelState
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_PIN, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady, ConfigEntryAuthFailed
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -20,121 +22,582 @@ from homeassistant.helpers.update_coordinator import (
 
 from .const import (
     DEFAULT_NAME,
+    DATA_ACCOUNT,
     DATA_CLIENT,
     DATA_COORDINATOR,
+    DATA_ENTITIES,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_EVENTS_SCAN_INTERVAL,
+    DEFAULT_INFO_SCAN_INTERVAL,
     CONF_DEVICE_IMEI,
     CONF_EVENTS_LIST_SIZE,
+    CONF_EVENTS_SCAN_INTERVAL,
+    CONF_INFO_SCAN_INTERVAL,
     DEFAULT_EVENTS_LIST_SIZE,
+    SCAN_INTERVAL_TOLERANCE,
+    OFFLINE_INFO_SCAN_INTERVAL,
+    CONF_STALE_GRACE_PERIOD,
+    DEFAULT_STALE_GRACE_PERIOD,
+    FAST_SCAN_INTERVAL,
+    IDLE_SCAN_INTERVAL_MAX,
+    EVENT_TYPE_ALARM,
+    EVENT_ELDES_ALARM,
+    EVENTS_PAGE_SIZE,
+    ALL_DEVICES,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_SAVE_INTERVAL,
+    DEVICE_FETCH_CONCURRENCY,
+    DEVICE_FETCH_STAGGER,
+    POLL_DEADLINE,
     DOMAIN,
 )
 
+from .account import async_acquire_account, async_release_account, async_remove_account_tokens
 from .core.eldes_cloud import EldesCloud
+from .core.models import EldesDeviceInfo
+from .core.event_buffer import EventRingBuffer, get_new_events
+from .services import async_setup_services
+from .snapshot import INDEXED_SECTIONS, async_load_snapshot, get_snapshot_store, serialize_devices
 
 _LOGGER = logging.getLogger(__name__)
 
+DEVICE_SECTIONS = ("info", "partitions", "outputs", "temp", "events")
+
 PLATFORMS = ["sensor", "binary_sensor", "switch", "alarm_control_panel"]
 
 CONFIG_SCHEMA = cv.deprecated(DOMAIN)
 
 
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the Eldes services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Eldes from a config entry."""
-    username = entry.data[CONF_USERNAME]
-    password = entry.data[CONF_PASSWORD]
-    pin = entry.data[CONF_PIN]
     selected_imei = entry.data[CONF_DEVICE_IMEI]
     scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
-    session = async_get_clientsession(hass)
-    eldes_client = EldesCloud(session, username, password, pin)
-
-    try:
-        await eldes_client.login()
-    except (asyncio.TimeoutError, ClientResponseError) as ex:
-        if isinstance(ex, ClientResponseError) and ex.status == HTTPStatus.UNAUTHORIZED:
-            raise ConfigEntryAuthFailed from ex
-        raise ConfigEntryNotReady from ex
-    except Exception as ex:
-        _LOGGER.error("Failed to login to Eldes: %s", ex)
-        return False
+    account = async_acquire_account(hass, entry)
+    eldes_client = account.client
 
-    async def async_update_data():
-        """Fetch data for selected Eldes device."""
+    snapshot_store = get_snapshot_store(hass, entry)
+    snapshot = await async_load_snapshot(snapshot_store)
+    if snapshot is not None and selected_imei != ALL_DEVICES and [d["imei"] for d in snapshot] != [selected_imei]:
+        snapshot = None
+
+    if snapshot is not None:
+        # Start from the last known data; login and the first refresh run in the background
+        imeis = [device["imei"] for device in snapshot]
+    else:
         try:
-            await eldes_client.renew_token()
-            return [await async_fetch_device_data(eldes_client, selected_imei, entry)]
+            await account.async_login()
+            if selected_imei == ALL_DEVICES:
+                imeis = [device["imei"] for device in await eldes_client.get_devices()]
+            else:
+                imeis = [selected_imei]
+        except (asyncio.TimeoutError, ClientResponseError) as ex:
+            await async_release_account(hass, entry)
+            if isinstance(ex, ClientResponseError) and ex.status == HTTPStatus.UNAUTHORIZED:
+                raise ConfigEntryAuthFailed from ex
+            raise ConfigEntryNotReady from ex
         except Exception as ex:
-            _LOGGER.exception("Failed to update Eldes device data: %s", ex)
-            raise UpdateFailed(ex) from ex
+            await async_release_account(hass, entry)
+            _LOGGER.error("Failed to login to Eldes: %s", ex)
+            return False
+
+    events_list_size = entry.options.get(CONF_EVENTS_LIST_SIZE, DEFAULT_EVENTS_LIST_SIZE)
+    last_fetched = {imei: {} for imei in imeis}
+    event_buffers = {imei: EventRingBuffer(events_list_size) for imei in imeis}
+    fan_out = asyncio.Semaphore(DEVICE_FETCH_CONCURRENCY)
+    snapshot_saved_at = None
+    # Snapshot data may be minutes old, so events newer than it were most likely fired before the restart
+    seeded_imeis = set(imeis) if snapshot is not None else set()
+    # Devices that failed on the first refresh; retried on every poll and set up once they answer
+    missing_imeis = []
+
+    async def async_fetch_device(index, imei, previous):
+        # Spread the device fetches so they don't all hit the cloud at the same instant
+        await asyncio.sleep(index * DEVICE_FETCH_STAGGER)
+        async with fan_out:
+            return await async_fetch_device_data(
+                eldes_client, imei, entry, previous, last_fetched[imei], event_buffers[imei]
+            )
+
+    async def async_update_data():
+        """Fetch data for all Eldes devices of this entry."""
+        nonlocal snapshot_saved_at
+
+        if not account.logged_in:
+            try:
+                await account.async_login()
+            except ClientResponseError as ex:
+                if ex.status == HTTPStatus.UNAUTHORIZED:
+                    raise ConfigEntryAuthFailed from ex
+                raise UpdateFailed(f"Failed to login to Eldes: {ex}") from ex
+            except Exception as ex:
+                raise UpdateFailed(f"Failed to login to Eldes: {ex}") from ex
+
+        previous_devices = coordinator.data or [None] * len(imeis)
+        results = await asyncio.gather(
+            *(async_fetch_device(index, imei, previous_devices[index]) for index, imei in enumerate(imeis)),
+            *(async_fetch_device(len(imeis) + index, imei, None) for index, imei in enumerate(missing_imeis)),
+            return_exceptions=True,
+        )
+        results, missing_results = results[:len(imeis)], results[len(imeis):]
+
+        if any(not isinstance(result, Exception) for result in missing_results):
+            # Set the entry up again so the entities of the recovered devices are created
+            _LOGGER.info("Eldes devices of %s are reachable again, reloading", entry.title)
+            await snapshot_store.async_remove()
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+
+        failed = [result for result in results if isinstance(result, Exception)]
+        if failed and len(failed) == len(results):
+            _LOGGER.error("Failed to update Eldes device data: %s", failed[0])
+            raise UpdateFailed(failed[0]) from failed[0]
+
+        if failed and coordinator.data is None:
+            # One unreachable device must not keep the others from being set up
+            for imei, result in zip(imeis, results):
+                if isinstance(result, Exception):
+                    _LOGGER.warning("Failed to set up Eldes device %s, retrying on the next polls: %s", imei, result)
+                    missing_imeis.append(imei)
+            imeis[:] = [imei for imei in imeis if imei not in missing_imeis]
+            results = [result for result in results if not isinstance(result, Exception)]
+            previous_devices = [None] * len(imeis)
+
+        scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        grace_period = entry.options.get(CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD)
+        current_interval = coordinator.update_interval.total_seconds()
+        devices = []
+        next_intervals = []
+
+        for imei, previous, result in zip(imeis, previous_devices, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to update Eldes device %s, keeping last data: %s", imei, result)
+                devices.append(get_failed_device(previous, time.monotonic(), grace_period))
+                continue
+
+            if imei in seeded_imeis:
+                # Don't replay events, or poll fast for them, on the first update after the snapshot
+                seeded_imeis.discard(imei)
+                previous = None
+            if previous is not None and _is_first_online_fetch(result, previous):
+                # The device was offline when set up, so none of its partitions, outputs or sensors have entities
+                _LOGGER.info("Eldes device %s came online for the first time, reloading", imei)
+                await snapshot_store.async_remove()
+                hass.config_entries.async_schedule_reload(entry.entry_id)
+                previous = None
+            if previous is not None:
+                async_fire_new_events(hass, result, previous)
+            next_intervals.append(get_next_update_interval(result, previous, current_interval, scan_interval))
+            devices.append(result)
+
+        coordinator.update_interval = timedelta(seconds=min(next_intervals))
+
+        if snapshot_saved_at is None or time.monotonic() - snapshot_saved_at >= SNAPSHOT_SAVE_INTERVAL:
+            snapshot_saved_at = time.monotonic()
+            snapshot_store.async_delay_save(lambda: serialize_devices(devices), SNAPSHOT_SAVE_DELAY)
+
+        return devices
 
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
-        name=f"Eldes {selected_imei}",
+        name=f"Eldes {entry.title}",
         update_method=async_update_data,
         update_interval=timedelta(seconds=scan_interval),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    if snapshot is None:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await async_release_account(hass, entry)
+            raise
+    else:
+        coordinator.data = snapshot
+        for device in snapshot:
+            event_buffers[device["imei"]].reset(device["events"])
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
+        DATA_ACCOUNT: account,
         DATA_CLIENT: eldes_client,
         DATA_COORDINATOR: coordinator,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if snapshot is not None:
+        async def async_refresh_seeded():
+            """Re-list the devices of an all-devices entry, then refresh the data seeded from the snapshot."""
+            if selected_imei == ALL_DEVICES:
+                try:
+                    await account.async_login()
+                    current_imeis = [device["imei"] for device in await eldes_client.get_devices()]
+                except Exception as ex:
+                    _LOGGER.warning("Failed to list Eldes devices, keeping the stored ones: %s", ex)
+                else:
+                    if set(current_imeis) != set(imeis):
+                        # The stored device list is outdated, set up again from the cloud
+                        _LOGGER.info("Eldes devices of %s changed, reloading", entry.title)
+                        await snapshot_store.async_remove()
+                        hass.config_entries.async_schedule_reload(entry.entry_id)
+                        return
+
+            await coordinator.async_refresh()
+
+        entry.async_create_background_task(
+            hass, async_refresh_seeded(), name=f"eldes_first_refresh_{entry.entry_id}"
+        )
+
     return True
 
 
-async def async_fetch_device_data(eldes_client: EldesCloud, imei: str, entry: ConfigEntry) -> dict:
-    """Fetch full data for a single Eldes device."""
+def get_section_intervals(entry: ConfigEntry) -> dict:
+    """Return the polling interval in seconds for each device data section."""
+    events_interval = entry.options.get(CONF_EVENTS_SCAN_INTERVAL, DEFAULT_EVENTS_SCAN_INTERVAL)
+    info_interval = entry.options.get(CONF_INFO_SCAN_INTERVAL, DEFAULT_INFO_SCAN_INTERVAL)
+
+    # Partitions and outputs are fetched on every coordinator poll, whose interval adapts to the device state
+    return {
+        "info": info_interval,
+        "partitions": 0,
+        "outputs": 0,
+        "temp": info_interval,
+        "events": events_interval,
+    }
+
+
+async def async_fetch_device_data(
+    eldes_client: EldesCloud,
+    imei: str,
+    entry: ConfigEntry,
+    previous: dict | None = None,
+    last_fetched: dict | None = None,
+    event_buffer: EventRingBuffer | None = None,
+) -> dict:
+    """Fetch data for a single Eldes device, reusing sections from previous that are not due yet."""
     events_list_size = entry.options.get(CONF_EVENTS_LIST_SIZE, DEFAULT_EVENTS_LIST_SIZE)
+    intervals = get_section_intervals(entry)
+    if last_fetched is None:
+        last_fetched = {}
+    if event_buffer is None:
+        event_buffer = EventRingBuffer(events_list_size)
+    event_buffer.resize(events_list_size)
 
-    device = {
-        "imei": imei,
-        "info": await eldes_client.get_device_info(imei),
-        "partitions": await eldes_client.get_device_partitions(imei),
-        "outputs": await eldes_client.get_device_outputs(imei),
-        "temp": await eldes_client.get_temperatures(imei),
-        "events": await eldes_client.get_events(imei, events_list_size),
+    fetchers = {
+        "info": lambda: eldes_client.get_device_info(imei),
+        "partitions": lambda: _async_fetch_indexed(eldes_client.get_device_partitions(imei), "internal_id"),
+        "outputs": lambda: _async_fetch_indexed(eldes_client.get_device_outputs(imei), "id"),
+        "temp": lambda: _async_fetch_indexed(eldes_client.get_temperatures(imei), "sensor_id"),
+        "events": lambda: async_fetch_new_events(eldes_client, imei, event_buffer),
     }
 
+    # While the device is offline the cloud only has stale data, so poll just its info until it is back
+    offline = previous is not None and previous["info"] is not None and not previous["info"].online
+    if offline:
+        intervals["info"] = OFFLINE_INFO_SCAN_INTERVAL
+
+    # Every section of this poll shares one budget, a slow section fails on its own
+    deadline = asyncio.get_running_loop().time() + POLL_DEADLINE
+
+    prefetched = {}
+    if previous is None:
+        # Learn whether the device is online before asking for data only an online device has
+        prefetched["info"] = await _async_with_deadline(fetchers["info"](), deadline)
+        offline = not prefetched["info"].online
+        if offline:
+            _LOGGER.info("Eldes device %s is offline, its data is fetched once it is back", imei)
+
+    now = time.monotonic()
+    due = [
+        section for section in (["info"] if offline else fetchers)
+        if section not in prefetched and (
+            previous is None
+            or section not in last_fetched
+            or section in previous["failed_since"]
+            or now - last_fetched[section] >= intervals[section] - SCAN_INTERVAL_TOLERANCE
+        )
+    ]
+
+    results = await asyncio.gather(
+        *(_async_with_deadline(fetchers[section](), deadline) for section in due), return_exceptions=True
+    )
+
+    if offline and due and isinstance(results[0], EldesDeviceInfo) and results[0].online:
+        _LOGGER.info("Eldes device %s is back online, refreshing all data", imei)
+        back_online = [section for section in fetchers if section != "info"]
+        results += await asyncio.gather(
+            *(_async_with_deadline(fetchers[section](), deadline) for section in back_online),
+            return_exceptions=True,
+        )
+        due += back_online
+
+    due = list(prefetched) + due
+    results = list(prefetched.values()) + results
+
+    # Without earlier data there is nothing to fall back to; otherwise the grace period decides availability
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors and previous is None:
+        raise errors[0]
+
+    grace_period = entry.options.get(CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD)
+    failed_since = dict(previous["failed_since"]) if previous is not None else {}
+
+    device = {"imei": imei}
+    for section in fetchers:
+        device[section] = previous[section] if previous is not None else None
+    if previous is None and offline:
+        # Nothing was fetched for the sections of an offline device yet
+        device.update(partitions={}, outputs={}, temp={}, events=[])
+
+    for section, result in zip(due, results):
+        if isinstance(result, Exception):
+            # Keep the last known good value and retry the section on the next poll
+            _LOGGER.warning("Failed to update %s of Eldes device %s: %s", section, imei, result)
+            failed_since.setdefault(section, now)
+            continue
+        device[section] = result
+        last_fetched[section] = now
+        failed_since.pop(section, None)
+
+    device["failed_since"] = failed_since
+    device["stale"] = _get_stale_sections(failed_since, now, grace_period)
+
     return device
 
 
+def _is_first_online_fetch(device: dict, previous: dict) -> bool:
+    return (
+        not previous["info"].online
+        and device["info"].online
+        and any(device[section] and not previous[section] for section in INDEXED_SECTIONS)
+    )
+
+
+def get_failed_device(previous: dict, now: float, grace_period: int) -> dict:
+    """Return the last data of a device whose update failed, with every section going stale after the grace period."""
+    failed_since = {section: previous["failed_since"].get(section, now) for section in DEVICE_SECTIONS}
+    return {**previous, "failed_since": failed_since, "stale": _get_stale_sections(failed_since, now, grace_period)}
+
+
+def _get_stale_sections(failed_since: dict, now: float, grace_period: int) -> set:
+    return {section for section, since in failed_since.items() if now - since >= grace_period}
+
+
+async def _async_with_deadline(fetch, deadline: float):
+    """Await fetch, raising TimeoutError once the poll deadline has passed."""
+    async with asyncio.timeout_at(deadline):
+        return await fetch
+
+
+async def _async_fetch_indexed(fetch, key: str) -> dict:
+    """Index the fetched items by their stable id."""
+    return {getattr(item, key): item for item in await fetch}
+
+
+async def async_fetch_new_events(eldes_client: EldesCloud, imei: str, event_buffer: EventRingBuffer) -> list:
+    """Fetch events page by page until the newest buffered event is reached."""
+    newest_key = event_buffer.newest_key
+    page_size = EVENTS_PAGE_SIZE if newest_key is not None else event_buffer.maxlen
+    start = 0
+    fetched = []
+    reached = False
+
+    while start < event_buffer.maxlen:
+        page = await eldes_client.get_events(imei, page_size, start)
+        for event in page:
+            if event.key == newest_key:
+                reached = True
+                break
+            fetched.append(event)
+
+        if reached or len(page) < page_size:
+            break
+        start += page_size
+        page_size = min(page_size * 2, event_buffer.maxlen - start)
+
+    if reached:
+        event_buffer.add_newer(fetched)
+    else:
+        # Nothing known was found, so the fetched events are the complete recent history
+        event_buffer.reset(fetched)
+
+    return event_buffer.events
+
+
+def get_next_update_interval(device: dict, previous: dict | None, current_interval: float, scan_interval: int) -> float:
+    """Poll fast while something is happening on the device and back off while it is idle.
+
+    Alarm commands confirm their own partition state, so they don't speed up the whole device.
+    """
+    partitions = device["partitions"].values() if device["partitions"] else []
+
+    if _has_new_alarm_event(device, previous) or any(
+        partition.has_unaccepted_alarms for partition in partitions
+    ):
+        return FAST_SCAN_INTERVAL
+
+    if any(partition.state != AlarmControlPanelState.DISARMED for partition in partitions):
+        return scan_interval
+
+    return min(max(current_interval, scan_interval) * 2, max(IDLE_SCAN_INTERVAL_MAX, scan_interval))
+
+
+def _has_new_alarm_event(device: dict, previous: dict | None) -> bool:
+    if previous is None:
+        return False
+
+    return any(
+        event.type == EVENT_TYPE_ALARM
+        for event in get_new_events(device["events"], previous["events"])
+    )
+
+
+@callback
+def async_fire_new_events(hass: HomeAssistant, device: dict, previous: dict):
+    """Fire an event on the Home Assistant bus for every Eldes event seen for the first time."""
+    for event in reversed(get_new_events(device["events"], previous["events"])):
+        hass.bus.async_fire(
+            EVENT_ELDES_ALARM,
+            {
+                "imei": device["imei"],
+                "type": event.type,
+                "name": event.name,
+                "message": event.message,
+                "event_time": event.event_time.isoformat(),
+            },
+        )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload Eldes config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        await async_release_account(hass, entry)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored data of a deleted config entry, and the account tokens once no entry uses them."""
+    await get_snapshot_store(hass, entry).async_remove()
+    await async_remove_account_tokens(hass, entry)
+
+
+class EldesAccountEntity(CoordinatorEntity):
+    """Defines a base entity for values shared by every device of an Eldes account."""
+
+    def __init__(self, account, coordinator):
+        """Initialize the Eldes account entity."""
+        super().__init__(coordinator)
+        self.account = account
+        self.client = account.client
+        self._written_slice = None
+
+    @property
+    def data_slice(self):
+        """Return the account values this entity renders."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the rendered account values changed."""
+        if self.data_slice == self._written_slice:
+            return
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._written_slice = self.data_slice
+        super().async_write_ha_state()
+
+    @property
+    def device_info(self):
+        """Return device info for the Eldes account."""
+        return {
+            "identifiers": {(DOMAIN, self.account.unique_id)},
+            "name": f"{DEFAULT_NAME} {self.account.username}",
+            "manufacturer": DEFAULT_NAME,
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+
 class EldesDeviceEntity(CoordinatorEntity):
     """Defines a base Eldes device entity."""
 
-    def __init__(self, client, coordinator, device_index, entity_index=None):
+    # Device data section this entity renders; keyed entities look their item up in it
+    section = "info"
+
+    def __init__(self, client, coordinator, device_index, entity_key=None):
         """Initialize the Eldes entity."""
         super().__init__(coordinator)
         self.client = client
         self.device_index = device_index
-        self.entity_index = entity_index
+        self.entity_key = entity_key
+        self._last_item = None
         self.imei = self.coordinator.data[self.device_index]["imei"]
+        self._written_slice = None
+        self._written_available = None
 
     @property
     def data(self):
         """Shortcut to access this device's data."""
         return self.coordinator.data[self.device_index]
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.hass.data[DOMAIN].setdefault(DATA_ENTITIES, {})[self.entity_id] = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        self.hass.data[DOMAIN].get(DATA_ENTITIES, {}).pop(self.entity_id, None)
+        await super().async_will_remove_from_hass()
+
+    @property
+    def item(self):
+        """Return this entity's item from its section, or the last known one if it disappeared."""
+        item = self.data[self.section].get(self.entity_key)
+        if item is not None:
+            self._last_item = item
+        return self._last_item
+
+    @property
+    def available(self):
+        if not super().available:
+            return False
+        if self.section in self.data["stale"]:
+            return False
+        return self.entity_key is None or self.entity_key in self.data[self.section]
+
+    @property
+    def data_slice(self):
+        """Return the part of the device data this entity renders."""
+        return self.data["info"]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this entity's slice of the data changed."""
+        if self.data_slice == self._written_slice and self.available == self._written_available:
+            return
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._written_slice = self.data_slice
+        self._written_available = self.available
+        super().async_write_ha_state()
+
     @property
     def device_info(self):
         """Return device info for the Eldes entity."""
         return {
             "identifiers": {(DOMAIN, self.imei)},
-            "name": self.data["info"]["model"],
+            "name": self.data["info"].model,
             "manufacturer": DEFAULT_NAME,
-            "sw_version": self.data["info"]["firmware"],
-            "model": self.data["info"]["model"],
+            "sw_version": self.data["info"].firmware,
+            "model": self.data["info"].model,
         }
@@ -0,0 +1,262 @@
+"""Account level registry for sharing an Eldes cloud client between config entries."""
+import asyncio
+import logging
+import time
+
+import aiohttp
+from aiohttp import ClientResponseError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_PIN, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    ALL_DEVICES,
+    DATA_ACCOUNTS,
+    CONF_DEVICE_IMEI,
+    CONF_DEDICATED_SESSION,
+    CONNECTION_DNS_CACHE_TTL,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    DEFAULT_DEDICATED_SESSION,
+    MAX_CONCURRENT_REQUESTS,
+    DOMAIN,
+    STORAGE_KEY_TOKENS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TOKEN_REFRESH_RETRY_MIN,
+    TOKEN_REFRESH_RETRY_MAX,
+)
+from .core.connection_stats import ConnectionStats
+from .core.eldes_cloud import EldesCloud
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EldesAccount:
+    """One Eldes cloud client and token shared by every entry of an account."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        username: str,
+        password: str,
+        pin: str,
+        dedicated_session: bool = DEFAULT_DEDICATED_SESSION,
+    ):
+        self.hass = hass
+        self.username = username
+        self._session = None
+        self._unsub_close = None
+
+        if dedicated_session:
+            stats = ConnectionStats()
+            self._session = self._create_session(stats)
+            self._unsub_close = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_close_session)
+            self.client = EldesCloud(self._session, username, password, pin)
+            self.client.connection_stats = stats
+        else:
+            self.client = EldesCloud(async_get_clientsession(hass), username, password, pin)
+        self.client.token_updated_callback = self._async_token_updated
+        self.entry_ids = set()
+        self.unique_id = slugify(username)
+        # Entry currently providing the account wide entities, and how each set up entry can add them
+        self._entities_entry_id = None
+        self._entity_adders = {}
+        self._login_lock = asyncio.Lock()
+        self._logged_in = False
+        self._unsub_token_refresh = None
+        self._token_refresh_task = None
+        self._closed = False
+        self._token_retry_delay = TOKEN_REFRESH_RETRY_MIN
+        self._store = get_token_store(hass, username)
+
+    @staticmethod
+    def _create_session(stats: ConnectionStats) -> aiohttp.ClientSession:
+        """Session with its own pool, sized to our request concurrency and kept alive between polls."""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=CONNECTION_DNS_CACHE_TTL,
+            keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+            ssl=get_default_context(),
+        )
+        return aiohttp.ClientSession(connector=connector, trace_configs=[stats.trace_config])
+
+    @callback
+    def async_provide_entities(self, entry_id: str, add_entities):
+        """Register how an entry adds the account wide entities; the first one registered adds them."""
+        self._entity_adders[entry_id] = add_entities
+        if self._entities_entry_id is None:
+            self._entities_entry_id = entry_id
+            add_entities()
+
+    @callback
+    def _async_hand_over_entities(self, entry_id: str):
+        """Let another set up entry add the account wide entities when the providing entry goes away."""
+        self._entity_adders.pop(entry_id, None)
+        if self._entities_entry_id != entry_id:
+            return
+        self._entities_entry_id = None
+        if self._entity_adders:
+            next_entry_id, add_entities = next(iter(self._entity_adders.items()))
+            self._entities_entry_id = next_entry_id
+            add_entities()
+
+    @property
+    def logged_in(self):
+        return self._logged_in
+
+    async def async_login(self):
+        """Log in once for all entries sharing this account."""
+        async with self._login_lock:
+            if self._logged_in:
+                return
+            if not await self._async_restore_token():
+                await self.client.login()
+            self._logged_in = True
+            self._schedule_token_refresh(self.client.token_refresh_delay)
+
+    async def _async_restore_token(self):
+        """Exchange a persisted refresh token instead of logging in with the password."""
+        stored = await self._store.async_load()
+        if not stored or not stored.get("refresh_token"):
+            return False
+
+        expires = stored.get("expires")
+        if expires is not None and expires <= time.time():
+            _LOGGER.debug("Stored Eldes refresh token for %s has expired", self.username)
+            return False
+
+        self.client.restore_refresh_token(stored["refresh_token"])
+        try:
+            await self.client.renew_token(force=True)
+        except Exception as ex:
+            _LOGGER.debug("Stored Eldes refresh token rejected, logging in: %s", ex)
+            return False
+
+        _LOGGER.debug("Restored Eldes session for %s from stored token", self.username)
+        return True
+
+    @callback
+    def _async_token_updated(self):
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self):
+        return {
+            "refresh_token": self.client.refresh_token,
+            "expires": self.client.refresh_token_expires,
+        }
+
+    async def async_close(self):
+        """Tear down the account once the last entry is gone."""
+        _LOGGER.debug("Closing Eldes account %s", self.username)
+        self._closed = True
+        self._cancel_token_refresh()
+        if self._token_refresh_task is not None:
+            self._token_refresh_task.cancel()
+            self._token_refresh_task = None
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self._async_close_session()
+
+    async def _async_close_session(self, _event: Event | None = None):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def _cancel_token_refresh(self):
+        if self._unsub_token_refresh is not None:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
+
+    def _schedule_token_refresh(self, delay):
+        """Renew the token in the background ahead of expiry, so polls never wait on auth."""
+        self._cancel_token_refresh()
+        if self._closed:
+            return
+        _LOGGER.debug("Next Eldes token refresh for %s in %.0f s", self.username, delay)
+        self._unsub_token_refresh = async_call_later(self.hass, delay, self._handle_token_refresh)
+
+    @callback
+    def _handle_token_refresh(self, _now):
+        self._unsub_token_refresh = None
+        self._token_refresh_task = self.hass.async_create_background_task(
+            self._async_refresh_token(), name=f"eldes_token_refresh_{self.username}"
+        )
+
+    async def _async_refresh_token(self):
+        try:
+            try:
+                await self.client.renew_token(force=True)
+            except ClientResponseError as ex:
+                if ex.status not in (401, 403):
+                    raise
+                _LOGGER.debug("Refresh token rejected, logging in again")
+                await self.client.login()
+        except Exception as ex:
+            delay = self._token_retry_delay
+            self._token_retry_delay = min(delay * 2, TOKEN_REFRESH_RETRY_MAX)
+            _LOGGER.warning("Failed to refresh Eldes token, retrying in %s s: %s", delay, ex)
+            self._schedule_token_refresh(delay)
+            return
+
+        self._token_retry_delay = TOKEN_REFRESH_RETRY_MIN
+        self._schedule_token_refresh(self.client.token_refresh_delay)
+
+
+def get_token_store(hass: HomeAssistant, username: str) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_TOKENS}.{slugify(username)}")
+
+
+def async_acquire_account(hass: HomeAssistant, entry: ConfigEntry) -> EldesAccount:
+    """Return the shared account for the entry credentials, creating it if needed."""
+    accounts = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_ACCOUNTS, {})
+    username = entry.data[CONF_USERNAME]
+
+    account = accounts.get(username)
+    if account is None:
+        account = EldesAccount(
+            hass,
+            username,
+            entry.data[CONF_PASSWORD],
+            entry.data[CONF_PIN],
+            entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION),
+        )
+        accounts[username] = account
+
+    if entry.data[CONF_DEVICE_IMEI] != ALL_DEVICES:
+        account.client.set_device_pin(entry.data[CONF_DEVICE_IMEI], entry.data[CONF_PIN])
+    account.entry_ids.add(entry.entry_id)
+    return account
+
+
+async def async_release_account(hass: HomeAssistant, entry: ConfigEntry):
+    """Drop the entry reference and tear the account down when it was the last one."""
+    accounts = hass.data.get(DOMAIN, {}).get(DATA_ACCOUNTS, {})
+    username = entry.data[CONF_USERNAME]
+
+    account = accounts.get(username)
+    if account is None:
+        return
+
+    account.entry_ids.discard(entry.entry_id)
+    account._async_hand_over_entities(entry.entry_id)
+    if not account.entry_ids:
+        accounts.pop(username, None)
+        await account.async_close()
+
+
+async def async_remove_account_tokens(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove the stored tokens of the account once its last entry is deleted."""
+    username = entry.data[CONF_USERNAME]
+    if any(
+        other.entry_id != entry.entry_id and other.data.get(CONF_USERNAME) == username
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        return
+    await get_token_store(hass, username).async_remove()
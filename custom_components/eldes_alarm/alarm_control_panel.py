@@ -1,5 +1,7 @@
 """Support for Eldes control panels."""
+import asyncio
 import logging
+import time
 
 from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelEntity,
@@ -8,6 +10,7 @@ from homeassistant.components.alarm_control_panel import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -15,11 +18,20 @@ from .const import (
     DATA_COORDINATOR,
     DOMAIN,
     ALARM_MODES,
+    ALARM_CONFIRM_INTERVAL,
+    ALARM_CONFIRM_TIMEOUT,
 )
 from . import EldesDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# State shown while a mode is being set, and the polled state that confirms it
+ALARM_MODE_STATES = {
+    ALARM_MODES["DISARM"]: (AlarmControlPanelState.DISARMING, AlarmControlPanelState.DISARMED),
+    ALARM_MODES["ARM_AWAY"]: (AlarmControlPanelState.ARMING, AlarmControlPanelState.ARMED_AWAY),
+    ALARM_MODES["ARM_HOME"]: (AlarmControlPanelState.ARMING, AlarmControlPanelState.ARMED_HOME),
+}
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up the Eldes alarm control panel platform."""
@@ -28,9 +40,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entities = []
 
     for device_index, device in enumerate(coordinator.data):
-        for partition_index in range(len(device["partitions"])):
-            entity = EldesAlarmPanel(client, coordinator, device_index, partition_index)
-            entity._attr_alarm_state = entity.partition["state"]
+        for partition_id in device["partitions"]:
+            entity = EldesAlarmPanel(client, coordinator, device_index, partition_id)
+            entity._attr_alarm_state = entity.partition.state
             entities.append(entity)
 
     async_add_entities(entities)
@@ -44,64 +56,132 @@ class EldesAlarmPanel(EldesDeviceEntity, AlarmControlPanelEntity):
             | AlarmControlPanelEntityFeature.ARM_HOME
     )
     _attr_code_arm_required = False
+    section = "partitions"
 
-    def __init__(self, client, coordinator, device_index, partition_index):
-        super().__init__(client, coordinator, device_index, partition_index)
-        self._previous_state = None
+    def __init__(self, client, coordinator, device_index, partition_id):
+        super().__init__(client, coordinator, device_index, partition_id)
+        self._transition_state = None
+        self._last_command_id = 0
 
     @property
     def partition(self):
-        return self.data["partitions"][self.entity_index]
+        return self.item
+
+    @property
+    def data_slice(self):
+        return self.partition, self._transition_state
 
     @property
     def unique_id(self):
-        return f"{self.imei}_zone_{self.partition['internalId']}"
+        return f"{self.imei}_zone_{self.partition.internal_id}"
 
     @property
     def name(self):
-        return self.partition["name"]
+        return self.partition.name
 
     @property
     def extra_state_attributes(self):
         return {
-            "armed": self.partition["armed"],
-            "armStay": self.partition["armStay"],
-            "state": self.partition["state"],
-            "hasUnacceptedPartitionAlarms": self.partition["hasUnacceptedPartitionAlarms"],
+            "armed": self.partition.armed,
+            "armStay": self.partition.arm_stay,
+            "state": self.partition.state,
+            "hasUnacceptedPartitionAlarms": self.partition.has_unaccepted_alarms,
         }
 
     @property
     def alarm_state(self) -> AlarmControlPanelState:
-        return self.partition["state"]
+        # Polls only see settled states, so show the transition until the command settles
+        return self._transition_state or self.partition.state
 
-    async def _async_set_alarm(self, mode: str, transition_state: AlarmControlPanelState) -> None:
-        self._previous_state = self.partition["state"]
-        self.partition["state"] = transition_state
+    def _start_transition(self, transition_state: AlarmControlPanelState) -> int:
+        self._last_command_id += 1
+        self._transition_state = transition_state
         self.async_write_ha_state()
+        return self._last_command_id
 
-        try:
-            await self.client.set_alarm(mode, self.imei, self.partition["internalId"])
-        except Exception as ex:
-            _LOGGER.error("Failed to set alarm (%s): %s", mode, ex)
-            self.partition["state"] = self._previous_state
-            self.async_write_ha_state()
-            raise
+    def _end_transition(self, command_id: int) -> None:
+        # A newer command on this partition keeps showing its own transition
+        if self._last_command_id == command_id:
+            self._transition_state = None
+        # Falls back to the latest polled partition state if the command did not settle
+        self.async_write_ha_state()
 
+    async def _async_set_alarm(self, mode: str) -> None:
+        error, = await async_set_alarm_mode([self], mode)
+        if error is not None:
+            raise error
 
     async def async_alarm_disarm(self, code=None) -> None:
-        await self._async_set_alarm(
-            ALARM_MODES["DISARM"],
-            AlarmControlPanelState.DISARMING
-        )
+        await self._async_set_alarm(ALARM_MODES["DISARM"])
 
     async def async_alarm_arm_away(self, code=None) -> None:
-        await self._async_set_alarm(
-            ALARM_MODES["ARM_AWAY"],
-            AlarmControlPanelState.ARMING
-        )
+        await self._async_set_alarm(ALARM_MODES["ARM_AWAY"])
 
     async def async_alarm_arm_home(self, code=None) -> None:
-        await self._async_set_alarm(
-            ALARM_MODES["ARM_HOME"],
-            AlarmControlPanelState.ARMING
+        await self._async_set_alarm(ALARM_MODES["ARM_HOME"])
+
+
+async def async_set_alarm_mode(panels: list, mode: str) -> list:
+    """Set mode on every panel, showing the transition until one partition poll per device confirms it.
+
+    Returns None for each panel that reached the requested state, otherwise the error explaining why not.
+    """
+    transition_state, target_state = ALARM_MODE_STATES[mode]
+    command_ids = [panel._start_transition(transition_state) for panel in panels]
+
+    try:
+        outcomes = await asyncio.gather(
+            *(panel.client.set_alarm(mode, panel.imei, panel.entity_key) for panel in panels),
+            return_exceptions=True,
         )
+
+        devices = {}
+        for panel, outcome in zip(panels, outcomes):
+            if isinstance(outcome, Exception):
+                _LOGGER.error("Failed to set alarm of %s (%s): %s", panel.name, mode, outcome)
+            else:
+                devices.setdefault((id(panel.client), panel.imei), []).append(panel)
+
+        unconfirmed = set()
+        for device_unconfirmed in await asyncio.gather(
+            *(_async_confirm_state(device_panels, target_state) for device_panels in devices.values())
+        ):
+            unconfirmed.update(id(panel) for panel in device_unconfirmed)
+    finally:
+        for panel, command_id in zip(panels, command_ids):
+            panel._end_transition(command_id)
+
+    errors = []
+    for panel, outcome in zip(panels, outcomes):
+        if isinstance(outcome, Exception):
+            errors.append(outcome)
+        elif id(panel) in unconfirmed:
+            errors.append(HomeAssistantError(
+                f"{panel.name} did not reach state {target_state} within {ALARM_CONFIRM_TIMEOUT} seconds"
+            ))
+        else:
+            errors.append(None)
+    return errors
+
+
+async def _async_confirm_state(panels: list, target_state: AlarmControlPanelState) -> list:
+    """Poll only the partitions of one device until every panel reaches target_state; return those that did not."""
+    client, imei = panels[0].client, panels[0].imei
+    waiting = {panel.entity_key: panel for panel in panels}
+    deadline = time.monotonic() + ALARM_CONFIRM_TIMEOUT
+
+    while waiting and time.monotonic() < deadline:
+        await asyncio.sleep(ALARM_CONFIRM_INTERVAL)
+        try:
+            partitions = await client.get_device_partitions(imei)
+        except Exception as ex:
+            _LOGGER.debug("Failed to confirm alarm state of Eldes device %s: %s", imei, ex)
+            continue
+
+        for partition in partitions:
+            panel = waiting.get(partition.internal_id)
+            if panel is not None and partition.state == target_state:
+                panel.data["partitions"][partition.internal_id] = partition
+                del waiting[partition.internal_id]
+
+    return list(waiting.values())
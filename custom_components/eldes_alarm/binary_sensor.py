@@ -40,11 +40,11 @@ class EldesConnectionStatusBinarySensor(EldesDeviceEntity, BinarySensorEntity):
 
     @property
     def name(self):
-        return f"{self.data['info']['model']} Connection Status"
+        return f"{self.data['info'].model} Connection Status"
 
     @property
     def is_on(self):
-        return self.data["info"].get("online", False)
+        return self.data["info"].online
 
     @property
     def device_class(self):
@@ -11,11 +11,21 @@ from .core.eldes_cloud import EldesCloud
 from .const import (
     DOMAIN,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_EVENTS_SCAN_INTERVAL,
+    DEFAULT_INFO_SCAN_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DEFAULT_DEDICATED_SESSION,
     DEFAULT_EVENTS_LIST_SIZE,
     CONF_EVENTS_LIST_SIZE,
+    CONF_EVENTS_SCAN_INTERVAL,
+    CONF_INFO_SCAN_INTERVAL,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_DEDICATED_SESSION,
     CONF_DEVICE_IMEI,
+    ALL_DEVICES,
     SCAN_INTERVAL_MIN,
     SCAN_INTERVAL_MAX,
+    SLOW_SCAN_INTERVAL_MAX,
     EVENTS_LIST_SIZE_MIN,
     EVENTS_LIST_SIZE_MAX,
 )
@@ -81,15 +91,42 @@ class EldesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             device["imei"]: f"{device['name']} ({device['imei']})"
             for device in self.devices
         }
+        if len(self.devices) > 1:
+            device_options[ALL_DEVICES] = f"All devices ({len(self.devices)})"
 
         if user_input is not None:
             selected_imei = user_input["device"]
+
+            if selected_imei == ALL_DEVICES:
+                # One entry and one coordinator polling every device of the account
+                await self.async_set_unique_id(f"{self.data[CONF_USERNAME]}_{ALL_DEVICES}")
+                self._abort_if_unique_id_configured()
+
+                # Entities of a device already set up on its own would get duplicate unique ids
+                imeis = {device["imei"] for device in self.devices}
+                if any(entry.data.get(CONF_DEVICE_IMEI) in imeis for entry in self._async_current_entries()):
+                    return self.async_abort(reason="devices_already_configured")
+
+                self.data[CONF_DEVICE_IMEI] = ALL_DEVICES
+
+                return self.async_create_entry(
+                    title=self.data[CONF_USERNAME],
+                    data=self.data
+                )
+
             selected_device = next((d for d in self.devices if d["imei"] == selected_imei), None)
 
             if selected_device:
                 await self.async_set_unique_id(selected_imei)
                 self._abort_if_unique_id_configured()
 
+                if any(
+                    entry.data.get(CONF_USERNAME) == self.data[CONF_USERNAME]
+                    and entry.data.get(CONF_DEVICE_IMEI) == ALL_DEVICES
+                    for entry in self._async_current_entries()
+                ):
+                    return self.async_abort(reason="account_already_configured")
+
                 self.data[CONF_DEVICE_IMEI] = selected_imei
 
                 return self.async_create_entry(
@@ -151,6 +188,27 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         int,
                         vol.Range(min=SCAN_INTERVAL_MIN, max=SCAN_INTERVAL_MAX)
                     ),
+                    vol.Required(
+                        CONF_EVENTS_SCAN_INTERVAL,
+                        default=self._config_entry.options.get(CONF_EVENTS_SCAN_INTERVAL, DEFAULT_EVENTS_SCAN_INTERVAL)
+                    ): vol.All(
+                        int,
+                        vol.Range(min=SCAN_INTERVAL_MIN, max=SLOW_SCAN_INTERVAL_MAX)
+                    ),
+                    vol.Required(
+                        CONF_INFO_SCAN_INTERVAL,
+                        default=self._config_entry.options.get(CONF_INFO_SCAN_INTERVAL, DEFAULT_INFO_SCAN_INTERVAL)
+                    ): vol.All(
+                        int,
+                        vol.Range(min=SCAN_INTERVAL_MIN, max=SLOW_SCAN_INTERVAL_MAX)
+                    ),
+                    vol.Required(
+                        CONF_STALE_GRACE_PERIOD,
+                        default=self._config_entry.options.get(CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD)
+                    ): vol.All(
+                        int,
+                        vol.Range(min=0, max=SLOW_SCAN_INTERVAL_MAX)
+                    ),
                     vol.Required(
                         CONF_EVENTS_LIST_SIZE,
                         default=self._config_entry.options.get(CONF_EVENTS_LIST_SIZE, DEFAULT_EVENTS_LIST_SIZE)
@@ -158,6 +216,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         int,
                         vol.Range(min=EVENTS_LIST_SIZE_MIN, max=EVENTS_LIST_SIZE_MAX)
                     ),
+                    vol.Required(
+                        CONF_DEDICATED_SESSION,
+                        default=self._config_entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION)
+                    ): bool,
                     vol.Required(
                         CONF_PIN,
                         default=self._config_entry.data.get(CONF_PIN)
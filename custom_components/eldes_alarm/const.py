@@ -5,16 +5,76 @@ DEFAULT_NAME = "Eldes"
 
 DATA_CLIENT = "eldes_client"
 DATA_COORDINATOR = "coordinator"
+DATA_ACCOUNT = "account"
+DATA_ACCOUNTS = "accounts"
+DATA_ENTITIES = "entities"
+STORAGE_VERSION = 1
+STORAGE_KEY_TOKENS = f"{DOMAIN}.tokens"
+STORAGE_KEY_SNAPSHOT = f"{DOMAIN}.snapshot"
+STORAGE_SAVE_DELAY = 1
+SNAPSHOT_SAVE_DELAY = 10
+SNAPSHOT_SAVE_INTERVAL = 300
 CONF_DEVICE_IMEI = "device_imei"
+ALL_DEVICES = "all"
 CONF_EVENTS_LIST_SIZE = "events_list_size"
+CONF_EVENTS_SCAN_INTERVAL = "events_scan_interval"
+CONF_INFO_SCAN_INTERVAL = "info_scan_interval"
+CONF_STALE_GRACE_PERIOD = "stale_grace_period"
+CONF_DEDICATED_SESSION = "dedicated_session"
 SCAN_INTERVAL_MIN = 5
 SCAN_INTERVAL_MAX = 300
+SLOW_SCAN_INTERVAL_MAX = 3600
+SCAN_INTERVAL_TOLERANCE = 1
+OFFLINE_INFO_SCAN_INTERVAL = 60
+FAST_SCAN_INTERVAL = 5
+IDLE_SCAN_INTERVAL_MAX = 120
+ALARM_CONFIRM_INTERVAL = 2
+ALARM_CONFIRM_TIMEOUT = 60
+OUTPUT_COMMAND_WINDOW = 0.5
 EVENTS_LIST_SIZE_MIN = 5
-EVENTS_LIST_SIZE_MAX = 50
+EVENTS_LIST_SIZE_MAX = 200
+EVENTS_PAGE_SIZE = 2
 
 DEFAULT_SCAN_INTERVAL = 15
+DEFAULT_EVENTS_SCAN_INTERVAL = 30
+DEFAULT_INFO_SCAN_INTERVAL = 300
+DEFAULT_STALE_GRACE_PERIOD = 120
+DEFAULT_DEDICATED_SESSION = False
 DEFAULT_EVENTS_LIST_SIZE = 10
 DEFAULT_OUTPUT_ICON = "ICON_1"
+MAX_CONCURRENT_REQUESTS = 3
+POLL_DEADLINE = 30
+CONNECTION_DNS_CACHE_TTL = 300
+CONNECTION_KEEPALIVE_TIMEOUT = 60
+
+# Seconds allowed per endpoint for sending the request and reading its body
+ENDPOINT_TIMEOUTS = {
+    "login": 15,
+    "token": 10,
+    "devices": 15,
+    "info": 10,
+    "partitions": 10,
+    "outputs": 10,
+    "temperatures": 10,
+    "events": 15,
+    "command": 20,
+}
+DEVICE_FETCH_CONCURRENCY = 2
+DEVICE_FETCH_STAGGER = 0.2
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60
+RETRY_ATTEMPTS = 2
+RETRY_BACKOFF_BASE = 1
+RETRY_BACKOFF_MAX = 30
+RETRY_AFTER_MAX = 60
+RATE_LIMIT_PER_SECOND = 2
+RATE_LIMIT_BURST = 30
+RATE_LIMIT_PRIORITY_RESERVE = 5
+
+TOKEN_LIFETIME_DEFAULT = 300
+TOKEN_REFRESH_MARGIN = 60
+TOKEN_REFRESH_RETRY_MIN = 5
+TOKEN_REFRESH_RETRY_MAX = 120
 
 API_URL = "https://cloud.eldesalarms.com:8083/api/"
 
@@ -57,6 +117,8 @@ ATTR_EVENTS = "events"
 ATTR_ALARMS = "alarms"
 ATTR_USER_ACTIONS = "user_actions"
 
+EVENT_ELDES_ALARM = f"{DOMAIN}_event"
+
 EVENT_TYPE_ALARM = "ALARM"
 EVENT_TYPE_ARM = "ARM"
 EVENT_TYPE_DISARM = "DISARM"
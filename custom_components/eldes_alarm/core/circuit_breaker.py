@@ -0,0 +1,66 @@
+"""Circuit breaker guarding calls to the Eldes cloud"""
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Stops calling the cloud after repeated failures and probes it again after a cool down."""
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    @property
+    def retry_in(self):
+        """Seconds until an open circuit lets a probe call through."""
+        if self.state != STATE_OPEN:
+            return 0
+        return max(self._opened_at + self.reset_timeout - time.monotonic(), 0)
+
+    def before_call(self):
+        """Raise CircuitOpenError if the call may not go through."""
+        if self.state == STATE_OPEN:
+            if self.retry_in > 0:
+                raise CircuitOpenError(f"Eldes cloud circuit is open, retry in {self.retry_in:.0f} s")
+            self.state = STATE_HALF_OPEN
+            _LOGGER.debug("Eldes cloud circuit half-open, probing")
+
+        if self.state == STATE_HALF_OPEN:
+            if self._probe_in_flight:
+                raise CircuitOpenError("Eldes cloud circuit is half-open, probe in flight")
+            self._probe_in_flight = True
+
+    def record_success(self):
+        if self.state != STATE_CLOSED:
+            _LOGGER.info("Eldes cloud circuit closed")
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_aborted(self):
+        """Release the probe of a call that ended without an answer, counting it as a failure."""
+        if self._probe_in_flight:
+            self.record_failure()
+
+    def record_failure(self):
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                _LOGGER.warning("Eldes cloud circuit opened after %s failures", self.failures)
+            self.state = STATE_OPEN
+            self._opened_at = time.monotonic()
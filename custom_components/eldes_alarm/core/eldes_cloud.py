@@ -1,66 +1,242 @@
 """Implementation for Eldes Cloud"""
 import asyncio
 import async_timeout
+import base64
+import json
 import logging
+import random
+import time
 import aiohttp
-from datetime import datetime, timedelta
 
-from homeassistant.components.alarm_control_panel import (
-    AlarmControlPanelState
+from ..const import (
+    API_URL,
+    API_PATHS,
+    MAX_CONCURRENT_REQUESTS,
+    ENDPOINT_TIMEOUTS,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RETRY_AFTER_MAX,
+    RATE_LIMIT_PER_SECOND,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PRIORITY_RESERVE,
+    OUTPUT_COMMAND_WINDOW,
+    TOKEN_LIFETIME_DEFAULT,
+    TOKEN_REFRESH_MARGIN,
 )
 
-from ..const import API_URL, API_PATHS
+from .circuit_breaker import CircuitBreaker
+from .output_coalescer import OutputCommandCoalescer
+from .rate_limiter import TokenBucket
+from .scheduler import PRIORITY_COMMAND, PRIORITY_POLL, RequestScheduler
+from .models import (
+    EldesDeviceInfo,
+    EldesEvent,
+    EldesOutput,
+    EldesPartition,
+    EldesTemperature,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-ALARM_STATES_MAP = {
-    "DISARMED": AlarmControlPanelState.DISARMED,
-    "ARMED": AlarmControlPanelState.ARMED_AWAY,
-    "ARMSTAY": AlarmControlPanelState.ARMED_HOME
-}
-
 
 class EldesCloud:
     """Interacts with Eldes via public API."""
 
-    def __init__(self, session: aiohttp.ClientSession, username: str, password: str, pin: str):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        password: str,
+        pin: str,
+        timeouts: dict | None = None,
+    ):
         self.timeout = 15
+        self.timeouts = {**ENDPOINT_TIMEOUTS, **(timeouts or {})}
+        self.connection_stats = None
         self.headers = {
             "X-Requested-With": "XMLHttpRequest",
             "x-whitelable": "eldes"
         }
+        self._token = ""
         self._refresh_token = ""
         self._token_expires_at = None
+        self._auth_task = None
+        self.token_updated_callback = None
+        self.scheduler = RequestScheduler(MAX_CONCURRENT_REQUESTS)
+        self._output_commands = OutputCommandCoalescer(self._send_output_state, OUTPUT_COMMAND_WINDOW)
+        self.last_command_latency = None
+        self._command_latency_total = 0.0
+        self._command_count = 0
+        self.circuit_breaker = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+        self.rate_limiter = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST, RATE_LIMIT_PRIORITY_RESERVE)
 
         self._http_session = session
         self._username = username
         self._password = password
         self._pin = pin
+        self._device_pins = {}
+
+    def set_device_pin(self, imei, pin):
+        """Use a specific PIN for one device of the account."""
+        self._device_pins[imei] = pin
+
+    def _get_pin(self, imei):
+        return self._device_pins.get(imei, self._pin)
 
     async def _setOAuthHeader(self, data):
         if "refreshToken" in data:
             self._refresh_token = data["refreshToken"]
 
         if "token" in data:
-            self.headers["Authorization"] = f"Bearer {data['token']}"
-            self._token_expires_at = datetime.utcnow() + timedelta(minutes=4)  # token lasts 5 minutes, refresh 1 minute before
+            self._token = data["token"]
+            expires = self._get_token_expiry(data["token"])
+            lifetime = expires - time.time() if expires is not None else TOKEN_LIFETIME_DEFAULT
+            self._token_expires_at = time.monotonic() + max(lifetime - TOKEN_REFRESH_MARGIN, 0)
+
+        if "refreshToken" in data and self.token_updated_callback is not None:
+            self.token_updated_callback()
 
         return data
 
-    async def _api_call(self, url, method, data=None):
+    @staticmethod
+    def _get_token_expiry(token):
+        """Read the expiry timestamp from the JWT exp claim, if there is one."""
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+            return float(claims["exp"])
+        except (IndexError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Unable to read token expiry: %s", err)
+            return None
+
+    @property
+    def refresh_token(self):
+        return self._refresh_token
+
+    @property
+    def refresh_token_expires(self):
+        """Wall clock expiry of the refresh token, or None when unknown."""
+        return self._get_token_expiry(self._refresh_token) if self._refresh_token else None
+
+    def restore_refresh_token(self, refresh_token):
+        """Use a persisted refresh token; the next renew_token call exchanges it."""
+        self._refresh_token = refresh_token
+        self._token = ""
+        self._token_expires_at = None
+
+    @property
+    def diagnostics(self):
+        """Return the state of the request budget, circuit breaker and connection reuse."""
+        diagnostics = {
+            "request_budget": round(self.rate_limiter.tokens, 1),
+            "request_budget_capacity": self.rate_limiter.capacity,
+            "request_rate_per_second": self.rate_limiter.rate,
+            "circuit_state": self.circuit_breaker.state,
+            "circuit_failures": self.circuit_breaker.failures,
+            "circuit_retry_in": round(self.circuit_breaker.retry_in),
+            "requests_in_flight": self.scheduler.in_flight,
+            "requests_queued": self.scheduler.queued,
+            "command_count": self._command_count,
+            "command_latency_last": self.last_command_latency,
+            "command_latency_average": (
+                self._command_latency_total / self._command_count if self._command_count else None
+            ),
+        }
+        if self.connection_stats is not None:
+            diagnostics["connections"] = self.connection_stats.as_dict()
+        return diagnostics
+
+    @property
+    def token_refresh_delay(self):
+        """Seconds until the token should be refreshed."""
+        if self._token_expires_at is None:
+            return 0
+        return max(self._token_expires_at - time.monotonic(), 0)
+
+    def _get_headers(self, token=None):
+        """Build a per-request snapshot of the headers."""
+        headers = dict(self.headers)
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+
+    async def _single_flight(self, auth_method):
+        """Coalesce concurrent token refreshes and logins into one in-flight call."""
+        if self._auth_task is None or self._auth_task.done():
+            self._auth_task = asyncio.ensure_future(auth_method())
+        return await asyncio.shield(self._auth_task)
+
+    async def _api_call(self, url, method, data=None, token=None, priority=False, endpoint=None, as_text=False):
+        """Send a request and return its parsed body, retrying transient failures."""
+        attempt = 0
+
+        while True:
+            self.circuit_breaker.before_call()
+            try:
+                response = await self._request(url, method, data, token, priority, endpoint, as_text)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                if not self._is_transient_error(err):
+                    # The cloud answered, it just did not like the request
+                    self.circuit_breaker.record_success()
+                    raise
+
+                self.circuit_breaker.record_failure()
+                if attempt >= RETRY_ATTEMPTS:
+                    raise
+
+                delay = self._get_retry_delay(err, attempt)
+                attempt += 1
+                _LOGGER.debug("Retrying %s in %.1f s (attempt %s)", url, delay, attempt)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled or otherwise broken calls must not leave a half-open probe hanging
+                self.circuit_breaker.record_aborted()
+                raise
+
+            self.circuit_breaker.record_success()
+            return response
+
+    @staticmethod
+    def _is_transient_error(err):
+        if isinstance(err, aiohttp.ClientResponseError):
+            return err.status >= 500 or err.status == 429
+        return True
+
+    @staticmethod
+    def _get_retry_delay(err, attempt):
+        """Honor Retry-After on 429, otherwise back off exponentially with full jitter."""
+        if isinstance(err, aiohttp.ClientResponseError) and err.status == 429 and err.headers:
+            try:
+                return min(float(err.headers.get("Retry-After")), RETRY_AFTER_MAX)
+            except (TypeError, ValueError):
+                pass
+        return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+    async def _request(self, url, method, data=None, token=None, priority=False, endpoint=None, as_text=False):
+        """Send, read and parse one request within the endpoint timeout; the connection is always released."""
+        headers = self._get_headers(token)
+        await self.rate_limiter.acquire(priority)
+
         try:
-            _LOGGER.debug("API Call -> %s %s | Headers: %s | Data: %s", method, url, self.headers, data)
+            _LOGGER.debug("API Call -> %s %s | Headers: %s | Data: %s", method, url, headers, data)
 
-            async with async_timeout.timeout(self.timeout):
-                req = await self._http_session.request(
+            slot = self.scheduler.slot(PRIORITY_COMMAND if priority else PRIORITY_POLL)
+            async with slot, async_timeout.timeout(self.timeouts.get(endpoint, self.timeout)):
+                async with self._http_session.request(
                     method,
                     url,
                     json=data,
-                    headers=self.headers
-                )
-
-            req.raise_for_status()
-            return req
+                    headers=headers
+                ) as response:
+                    response.raise_for_status()
+                    if as_text:
+                        return await response.text()
+                    return await response.json()
 
         except aiohttp.ClientResponseError as err:
             _LOGGER.error("Client response error on API %s request: %s", url, err)
@@ -74,22 +250,41 @@ class EldesCloud:
             _LOGGER.error("Timeout error on API request: %s", url)
             raise
 
-    async def _safe_api_call(self, url, method, data=None):
+    async def _command_call(self, url, method, data):
+        """Send a user command ahead of queued polls and record how long the cloud took to acknowledge it."""
+        started = time.monotonic()
+        response = await self._safe_api_call(url, method, data, priority=True, endpoint="command", as_text=True)
+
+        latency = time.monotonic() - started
+        self.last_command_latency = latency
+        self._command_latency_total += latency
+        self._command_count += 1
+        _LOGGER.debug("Command %s acknowledged in %.3f s", url, latency)
+        return response
+
+    async def _safe_api_call(self, url, method, data=None, priority=False, endpoint=None, as_text=False):
+        token = self._token
+
         try:
-            return await self._api_call(url, method, data)
+            return await self._api_call(url, method, data, token, priority, endpoint, as_text)
 
         except aiohttp.ClientResponseError as err:
             if err.status in (401, 403):
-                _LOGGER.warning("Auth error (%s) on %s - attempting to re-authenticate.", err.status, url)
-                await self.login()
+                # Only re-authenticate if nobody replaced the token while this request was in flight
+                if token == self._token:
+                    _LOGGER.warning("Auth error (%s) on %s - attempting to re-authenticate.", err.status, url)
+                    await self.login()
                 try:
-                    return await self._api_call(url, method, data)
+                    return await self._api_call(url, method, data, self._token, priority, endpoint, as_text)
                 except Exception as retry_err:
                     _LOGGER.error("Retry failed for %s: %s", url, retry_err)
                     raise
             raise
 
     async def login(self):
+        return await self._single_flight(self._login)
+
+    async def _login(self):
         data = {
             "email": self._username,
             "password": self._password,
@@ -97,26 +292,23 @@ class EldesCloud:
         }
 
         url = f"{API_URL}{API_PATHS['AUTH']}login"
-        resp = await self._api_call(url, "POST", data)
-        result = await resp.json()
+        result = await self._api_call(url, "POST", data, priority=True, endpoint="login")
 
         _LOGGER.debug("login result: %s", result)
         return await self._setOAuthHeader(result)
 
-    async def renew_token(self):
-        if not self._token_expires_at or datetime.utcnow() < self._token_expires_at:
+    async def renew_token(self, force=False):
+        if not force and (not self._token_expires_at or time.monotonic() < self._token_expires_at):
             _LOGGER.debug("Token is still valid; skipping token refresh.")
             return
 
-        self.headers["Authorization"] = f"Bearer {self._refresh_token}"
+        return await self._single_flight(self._renew_token)
+
+    async def _renew_token(self):
         url = f"{API_URL}{API_PATHS['AUTH']}token"
 
         try:
-            async with async_timeout.timeout(self.timeout):
-                response = await self._http_session.get(url, headers=self.headers)
-
-            response.raise_for_status()
-            result = await response.json()
+            result = await self._api_call(url, "GET", token=self._refresh_token, priority=True, endpoint="token")
 
             _LOGGER.debug("Token successfully refreshed: %s", result)
             return await self._setOAuthHeader(result)
@@ -131,63 +323,58 @@ class EldesCloud:
 
     async def get_devices(self):
         url = f"{API_URL}{API_PATHS['DEVICE']}list"
-        response = await self._safe_api_call(url, "GET")
-        result = await response.json()
+        result = await self._safe_api_call(url, "GET", endpoint="devices")
         return result.get("deviceListEntries", [])
 
     async def get_device_info(self, imei):
         url = f"{API_URL}{API_PATHS['DEVICE']}info?imei={imei}"
-        response = await self._safe_api_call(url, "GET")
-        return await response.json()
+        result = await self._safe_api_call(url, "GET", endpoint="info")
+        return EldesDeviceInfo.from_dict(result)
 
     async def get_device_partitions(self, imei):
-        data = {"imei": imei, "pin": self._pin}
+        data = {"imei": imei, "pin": self._get_pin(imei)}
         url = f"{API_URL}{API_PATHS['DEVICE']}partition/list?imei={imei}"
-        response = await self._safe_api_call(url, "POST", data)
-        result = await response.json()
-        partitions = result.get("partitions", [])
-
-        for partition in partitions:
-            state = partition.get("state", AlarmControlPanelState.DISARMED)
-            partition["state"] = ALARM_STATES_MAP.get(state, AlarmControlPanelState.DISARMED)
-
-        return partitions
+        result = await self._safe_api_call(url, "POST", data, endpoint="partitions")
+        return [EldesPartition.from_dict(partition) for partition in result.get("partitions", [])]
 
     async def get_device_outputs(self, imei):
-        data = {"imei": imei, "pin": self._pin}
+        data = {"imei": imei, "pin": self._get_pin(imei)}
         url = f"{API_URL}{API_PATHS['DEVICE']}list-outputs/{imei}"
-        response = await self._safe_api_call(url, "POST", data)
-        result = await response.json()
-        return result.get("deviceOutputs", [])
+        result = await self._safe_api_call(url, "POST", data, endpoint="outputs")
+        return [EldesOutput.from_dict(output) for output in result.get("deviceOutputs", [])]
 
     async def set_alarm(self, mode, imei, zone_id):
-        data = {"imei": imei, "partitionIndex": zone_id, "pin": self._pin}
+        data = {"imei": imei, "partitionIndex": zone_id, "pin": self._get_pin(imei)}
         url = f"{API_URL}{API_PATHS['DEVICE']}action/{mode}"
-        response = await self._safe_api_call(url, "POST", data)
-        return await response.text()
+        return await self._command_call(url, "POST", data)
 
     async def turn_on_output(self, imei, output_id):
-        data = {"": "", "pin": self._pin}
+        data = {"": "", "pin": self._get_pin(imei)}
         url = f"{API_URL}{API_PATHS['DEVICE']}control/enable/{imei}/{output_id}"
-        response = await self._safe_api_call(url, "PUT", data)
-        return response
+        return await self._command_call(url, "PUT", data)
 
     async def turn_off_output(self, imei, output_id):
-        data = {"": "", "pin": self._pin}
+        data = {"": "", "pin": self._get_pin(imei)}
         url = f"{API_URL}{API_PATHS['DEVICE']}control/disable/{imei}/{output_id}"
-        response = await self._safe_api_call(url, "PUT", data)
-        return response
+        return await self._command_call(url, "PUT", data)
+
+    async def set_output(self, imei, output_id, state):
+        """Switch an output, coalescing rapid toggles of the same output into one request."""
+        return await self._output_commands.set_state(imei, output_id, state)
+
+    async def _send_output_state(self, imei, output_id, state):
+        if state:
+            return await self.turn_on_output(imei, output_id)
+        return await self.turn_off_output(imei, output_id)
 
     async def get_temperatures(self, imei):
-        data = {"": "", "pin": self._pin}
+        data = {"": "", "pin": self._get_pin(imei)}
         url = f"{API_URL}{API_PATHS['DEVICE']}temperatures?imei={imei}"
-        response = await self._safe_api_call(url, "POST", data)
-        result = await response.json()
-        return result.get("temperatureDetailsList", [])
+        result = await self._safe_api_call(url, "POST", data, endpoint="temperatures")
+        return [EldesTemperature.from_dict(temp) for temp in result.get("temperatureDetailsList", [])]
 
-    async def get_events(self, imei, size):
-        data = {"": "", "imei": imei, "size": size, "start": 0, "pin": self._pin}
+    async def get_events(self, imei, size, start=0):
+        data = {"": "", "imei": imei, "size": size, "start": start, "pin": self._get_pin(imei)}
         url = f"{API_URL}{API_PATHS['DEVICE']}event/list"
-        response = await self._safe_api_call(url, "POST", data)
-        result = await response.json()
-        return result.get("eventDetails", [])
+        result = await self._safe_api_call(url, "POST", data, endpoint="events")
+        return [EldesEvent.from_dict(event) for event in result.get("eventDetails", [])]
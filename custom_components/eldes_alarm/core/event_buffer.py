@@ -0,0 +1,63 @@
+"""Bounded local history of Eldes device events"""
+from collections import deque
+
+
+def get_new_events(events, previous_events):
+    """Return the events not present in previous_events, newest first."""
+    if events is previous_events:
+        return []
+    known = {event.key for event in previous_events or []}
+    return [event for event in events or [] if event.key not in known]
+
+
+class EventRingBuffer:
+    """De-duplicated ring buffer of device events, newest first."""
+
+    def __init__(self, maxlen):
+        self._events = deque(maxlen=maxlen)
+        self._keys = set()
+        self._snapshot = []
+
+    @property
+    def maxlen(self):
+        return self._events.maxlen
+
+    @property
+    def newest_key(self):
+        return self._events[0].key if self._events else None
+
+    @property
+    def events(self):
+        """Return the buffered events as a list; the same list is returned until the buffer changes."""
+        return self._snapshot
+
+    def resize(self, maxlen):
+        if maxlen != self._events.maxlen:
+            self._events = deque(self._events, maxlen=maxlen)
+            self._keys = {event.key for event in self._events}
+            self._snapshot = list(self._events)
+
+    def reset(self, events):
+        """Replace the buffer content with events, newest first."""
+        self._events.clear()
+        self._keys.clear()
+        self.add_newer(events)
+        self._snapshot = list(self._events)
+
+    def add_newer(self, events):
+        """Prepend events newer than the buffer content, newest first; return the ones not seen before."""
+        added = []
+        for event in reversed(events):
+            key = event.key
+            if key in self._keys:
+                continue
+            if len(self._events) == self._events.maxlen:
+                self._keys.discard(self._events.pop().key)
+            self._events.appendleft(event)
+            self._keys.add(key)
+            added.append(event)
+
+        if added:
+            self._snapshot = list(self._events)
+        added.reverse()
+        return added
@@ -0,0 +1,182 @@
+"""Typed models for Eldes cloud payloads"""
+from dataclasses import dataclass
+from datetime import datetime
+
+from homeassistant.components.alarm_control_panel import AlarmControlPanelState
+
+from ..const import EVENT_TYPE_ARM, EVENT_TYPE_DISARM
+
+ALARM_STATES_MAP = {
+    "DISARMED": AlarmControlPanelState.DISARMED,
+    "ARMED": AlarmControlPanelState.ARMED_AWAY,
+    "ARMSTAY": AlarmControlPanelState.ARMED_HOME
+}
+CLOUD_STATES_MAP = {state: cloud_state for cloud_state, state in ALARM_STATES_MAP.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class EldesDeviceInfo:
+    """Device info as returned by device/info."""
+
+    model: str
+    firmware: str
+    online: bool
+    battery_status: bool
+    gsm_strength: int
+    phone_number: str
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            model=data.get("model", ""),
+            firmware=data.get("firmware", ""),
+            online=data.get("online", False),
+            battery_status=data.get("batteryStatus", False),
+            gsm_strength=data.get("gsmStrength", 0),
+            phone_number=data.get("phoneNumber", ""),
+        )
+
+    def as_dict(self):
+        return {
+            "model": self.model,
+            "firmware": self.firmware,
+            "online": self.online,
+            "batteryStatus": self.battery_status,
+            "gsmStrength": self.gsm_strength,
+            "phoneNumber": self.phone_number,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class EldesPartition:
+    """Alarm partition state."""
+
+    internal_id: int
+    name: str
+    armed: bool
+    arm_stay: bool
+    state: AlarmControlPanelState
+    has_unaccepted_alarms: bool
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            internal_id=data["internalId"],
+            name=data.get("name", ""),
+            armed=data.get("armed", False),
+            arm_stay=data.get("armStay", False),
+            state=ALARM_STATES_MAP.get(data.get("state"), AlarmControlPanelState.DISARMED),
+            has_unaccepted_alarms=data.get("hasUnacceptedPartitionAlarms", False),
+        )
+
+    def as_dict(self):
+        return {
+            "internalId": self.internal_id,
+            "name": self.name,
+            "armed": self.armed,
+            "armStay": self.arm_stay,
+            "state": CLOUD_STATES_MAP.get(self.state, "DISARMED"),
+            "hasUnacceptedPartitionAlarms": self.has_unaccepted_alarms,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class EldesOutput:
+    """Output (switch) state."""
+
+    id: int
+    name: str
+    output_state: bool
+    has_fault: bool
+    type: str
+    icon_name: str | None
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            id=data["id"],
+            name=data.get("name", ""),
+            output_state=data.get("outputState", False),
+            has_fault=data.get("hasFault", False),
+            type=data.get("type", ""),
+            icon_name=data.get("iconName"),
+        )
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "outputState": self.output_state,
+            "hasFault": self.has_fault,
+            "type": self.type,
+            "iconName": self.icon_name,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class EldesTemperature:
+    """Temperature sensor reading."""
+
+    sensor_id: int
+    sensor_name: str
+    temperature: float
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            sensor_id=data["sensorId"],
+            sensor_name=data.get("sensorName", ""),
+            temperature=data.get("temperature", 0.0),
+        )
+
+    def as_dict(self):
+        return {
+            "sensorId": self.sensor_id,
+            "sensorName": self.sensor_name,
+            "temperature": self.temperature,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class EldesEvent:
+    """Device event log entry."""
+
+    id: int | None
+    type: str
+    message: str
+    device_time: tuple
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            id=data.get("id"),
+            type=data.get("type", ""),
+            message=data.get("message", ""),
+            device_time=tuple(data.get("deviceTime", [])),
+        )
+
+    @property
+    def key(self):
+        """Stable key identifying the event."""
+        if self.id is not None:
+            return self.id
+        return self.device_time, self.message
+
+    @property
+    def event_time(self):
+        """Event time built from device_time, defaulting missing parts."""
+        device_time = self.device_time + (2000, 1, 1, 0, 0, 0)[len(self.device_time):]
+        return datetime(*device_time[:6])
+
+    @property
+    def name(self):
+        """User name of an arm/disarm event, taken from the first word of its message."""
+        if self.type not in (EVENT_TYPE_ARM, EVENT_TYPE_DISARM):
+            return None
+        return self.message.split(" ")[0] if self.message else ""
+
+    def as_dict(self):
+        data = {"type": self.type, "message": self.message, "deviceTime": list(self.device_time)}
+        if self.id is not None:
+            data["id"] = self.id
+        return data
@@ -0,0 +1,51 @@
+"""Coalescing of rapid output switch commands"""
+import asyncio
+
+
+class _PendingCommand:
+    """Desired output state waiting to be sent, shared by every caller of the burst."""
+
+    def __init__(self, state):
+        self.state = state
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class OutputCommandCoalescer:
+    """Sends only the last desired state of commands issued for one output within a short window.
+
+    Sends for the same output never overlap, so a later command always lands after an earlier one.
+    """
+
+    def __init__(self, send, window):
+        self._send = send
+        self._window = window
+        self._pending = {}
+        self._locks = {}
+        self._tasks = set()
+
+    async def set_state(self, imei, output_id, state):
+        key = (imei, output_id)
+        pending = self._pending.get(key)
+
+        if pending is None:
+            pending = self._pending[key] = _PendingCommand(state)
+            task = asyncio.ensure_future(self._async_flush(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            pending.state = state
+
+        return await asyncio.shield(pending.future)
+
+    async def _async_flush(self, key):
+        await asyncio.sleep(self._window)
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            # Commands arriving from now on start a new burst that is sent after this one
+            pending = self._pending.pop(key)
+            try:
+                result = await self._send(*key, pending.state)
+            except Exception as ex:
+                pending.future.set_exception(ex)
+            else:
+                pending.future.set_result(result)
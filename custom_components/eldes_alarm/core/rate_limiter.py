@@ -0,0 +1,36 @@
+"""Token bucket limiting the request rate to the Eldes cloud"""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket where priority callers may also spend a reserve that background callers leave alone."""
+
+    def __init__(self, rate, capacity, priority_reserve):
+        self.rate = rate
+        self.capacity = capacity
+        self.priority_reserve = priority_reserve
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+    @property
+    def tokens(self):
+        """Currently available request budget."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, priority=False):
+        """Wait until a token is available and take it."""
+        floor = 0 if priority else self.priority_reserve
+
+        while True:
+            self._refill()
+            if self._tokens >= floor + 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((floor + 1 - self._tokens) / self.rate)
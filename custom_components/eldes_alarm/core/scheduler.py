@@ -0,0 +1,54 @@
+"""Priority aware scheduling of concurrent Eldes cloud requests"""
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class RequestScheduler:
+    """Limits requests in flight; queued commands are let through before queued polls."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.in_flight = 0
+        self._waiters = []
+        self._counter = itertools.count()
+
+    @property
+    def queued(self):
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, priority=PRIORITY_POLL):
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority):
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was already handed over, pass it on
+                self._release()
+            raise
+
+    def _release(self):
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # Hand the slot over directly, in_flight stays the same
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
@@ -0,0 +1,19 @@
+"""Diagnostics support for Eldes."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_PIN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_CLIENT, DOMAIN
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_PIN}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for an Eldes config entry."""
+    client = hass.data[DOMAIN][entry.entry_id][DATA_CLIENT]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "cloud": client.diagnostics,
+    }
@@ -1,16 +1,17 @@
 """Support for Eldes sensors."""
 import logging
-from datetime import datetime
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    DATA_ACCOUNT,
     DATA_CLIENT,
     DATA_COORDINATOR,
+    DEFAULT_NAME,
     DOMAIN,
     SIGNAL_STRENGTH_MAP,
     BATTERY_STATUS_MAP,
@@ -21,7 +22,8 @@ from .const import (
     EVENT_TYPE_ARM,
     EVENT_TYPE_DISARM,
 )
-from . import EldesDeviceEntity
+from . import EldesAccountEntity, EldesDeviceEntity
+from .core.circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,15 +32,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     """Set up the Eldes sensor platform."""
     client = hass.data[DOMAIN][entry.entry_id][DATA_CLIENT]
     coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    account = hass.data[DOMAIN][entry.entry_id][DATA_ACCOUNT]
     entities = []
 
+    # Cloud status and command latency are shared by the whole account, so one entry at a time provides them
+    account.async_provide_entities(
+        entry.entry_id,
+        lambda: async_add_entities([
+            EldesCloudStatusSensor(account, coordinator),
+            EldesCommandLatencySensor(account, coordinator),
+        ]),
+    )
+
     for index in range(len(coordinator.data)):
         entities.append(EldesBatteryStatusSensor(client, coordinator, index))
         entities.append(EldesGSMStrengthSensor(client, coordinator, index))
         entities.append(EldesPhoneNumberSensor(client, coordinator, index))
         entities.append(EventsSensor(client, coordinator, index))
-        for temp_index in range(len(coordinator.data[index]["temp"])):
-            entities.append(EldesTemperatureSensor(client, coordinator, index, temp_index))
+        for sensor_id in coordinator.data[index]["temp"]:
+            entities.append(EldesTemperatureSensor(client, coordinator, index, sensor_id))
 
     async_add_entities(entities)
 
@@ -52,15 +64,15 @@ class EldesBatteryStatusSensor(EldesDeviceEntity, SensorEntity):
 
     @property
     def name(self):
-        return f"{self.data['info']['model']} Battery Status"
+        return f"{self.data['info'].model} Battery Status"
 
     @property
     def icon(self):
-        return "mdi:battery" if self.data["info"].get("batteryStatus") else "mdi:battery-alert-variant-outline"
+        return "mdi:battery" if self.data["info"].battery_status else "mdi:battery-alert-variant-outline"
 
     @property
     def native_value(self):
-        return BATTERY_STATUS_MAP[self.data["info"].get("batteryStatus", False)]
+        return BATTERY_STATUS_MAP[self.data["info"].battery_status]
 
 
 class EldesGSMStrengthSensor(EldesDeviceEntity, SensorEntity):
@@ -72,11 +84,11 @@ class EldesGSMStrengthSensor(EldesDeviceEntity, SensorEntity):
 
     @property
     def name(self):
-        return f"{self.data['info']['model']} GSM Strength"
+        return f"{self.data['info'].model} GSM Strength"
 
     @property
     def icon(self):
-        return "mdi:signal" if self.data["info"].get("gsmStrength", 0) > 0 else "mdi:signal-off"
+        return "mdi:signal" if self.data["info"].gsm_strength > 0 else "mdi:signal-off"
 
     @property
     def native_unit_of_measurement(self):
@@ -84,7 +96,7 @@ class EldesGSMStrengthSensor(EldesDeviceEntity, SensorEntity):
 
     @property
     def native_value(self):
-        return SIGNAL_STRENGTH_MAP[self.data["info"].get("gsmStrength", 0)]
+        return SIGNAL_STRENGTH_MAP[self.data["info"].gsm_strength]
 
 
 class EldesPhoneNumberSensor(EldesDeviceEntity, SensorEntity):
@@ -96,7 +108,7 @@ class EldesPhoneNumberSensor(EldesDeviceEntity, SensorEntity):
 
     @property
     def name(self):
-        return f"{self.data['info']['model']} Phone Number"
+        return f"{self.data['info'].model} Phone Number"
 
     @property
     def icon(self):
@@ -104,23 +116,100 @@ class EldesPhoneNumberSensor(EldesDeviceEntity, SensorEntity):
 
     @property
     def native_value(self):
-        return self.data["info"].get("phoneNumber", "")
+        return self.data["info"].phone_number
+
+
+class EldesCloudStatusSensor(EldesAccountEntity, SensorEntity):
+    """Class for the cloud circuit breaker diagnostic sensor."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN]
+
+    @property
+    def data_slice(self):
+        breaker = self.client.circuit_breaker
+        return breaker.state, breaker.failures
+
+    @property
+    def available(self):
+        # Stays available while the cloud is failing, that is when it matters
+        return True
+
+    @property
+    def unique_id(self):
+        return f"{self.account.unique_id}_cloud_status"
+
+    @property
+    def name(self):
+        return f"{DEFAULT_NAME} Cloud Status"
+
+    @property
+    def icon(self):
+        return "mdi:cloud-check" if self.native_value == STATE_CLOSED else "mdi:cloud-alert"
+
+    @property
+    def native_value(self):
+        return self.client.circuit_breaker.state
+
+    @property
+    def extra_state_attributes(self):
+        breaker = self.client.circuit_breaker
+        return {
+            "failures": breaker.failures,
+            "retry_in": round(breaker.retry_in),
+        }
+
+
+class EldesCommandLatencySensor(EldesAccountEntity, SensorEntity):
+    """Class for the command acknowledgement latency diagnostic sensor."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    @property
+    def data_slice(self):
+        return self.client.last_command_latency
+
+    @property
+    def unique_id(self):
+        return f"{self.account.unique_id}_command_latency"
+
+    @property
+    def name(self):
+        return f"{DEFAULT_NAME} Command Latency"
+
+    @property
+    def icon(self):
+        return "mdi:timer-outline"
+
+    @property
+    def native_value(self):
+        latency = self.client.last_command_latency
+        return round(latency * 1000) if latency is not None else None
 
 
 class EldesTemperatureSensor(EldesDeviceEntity, SensorEntity):
     """Class for the temperature sensor."""
 
+    section = "temp"
+
     @property
     def temp(self):
-        return self.data["temp"][self.entity_index]
+        return self.item
+
+    @property
+    def data_slice(self):
+        return self.temp
 
     @property
     def unique_id(self):
-        return f"{self.imei}_{self.temp['sensorName']}_{self.temp['sensorId']}_temperature"
+        return f"{self.imei}_{self.temp.sensor_name}_{self.temp.sensor_id}_temperature"
 
     @property
     def name(self):
-        return f"{self.temp['sensorName']} Temperature"
+        return f"{self.temp.sensor_name} Temperature"
 
     @property
     def device_class(self):
@@ -132,12 +221,23 @@ class EldesTemperatureSensor(EldesDeviceEntity, SensorEntity):
 
     @property
     def native_value(self):
-        return self.temp.get("temperature", 0.0)
+        return self.temp.temperature
 
 
 class EventsSensor(EldesDeviceEntity, SensorEntity):
     """Class for the events sensor."""
 
+    section = "events"
+
+    def __init__(self, client, coordinator, device_index):
+        super().__init__(client, coordinator, device_index)
+        self._parsed_events = None
+        self._attributes = None
+
+    @property
+    def data_slice(self):
+        return self.data.get("events")
+
     @property
     def unique_id(self):
         return f"{self.imei}_events"
@@ -148,53 +248,38 @@ class EventsSensor(EldesDeviceEntity, SensorEntity):
 
     @property
     def native_value(self):
-        return len(self.data.get("events", []))
+        return len(self.data.get("events") or [])
 
     @property
     def extra_state_attributes(self):
+        # The events list is only replaced when new events arrive, so parse it once per change
+        events = self.data.get("events")
+        if self._attributes is None or events is not self._parsed_events:
+            self._attributes = self.__parse_events(events or [])
+            self._parsed_events = events
+        return self._attributes
+
+    @property
+    def icon(self):
+        return "mdi:calendar"
+
+    @staticmethod
+    def __parse_events(source_events):
         events = []
         alarms = []
         user_actions = []
-        for event in self.data.get("events", []):
-            if event["type"] == EVENT_TYPE_ALARM:
-                alarms.append(self.__add_time(event))
-            elif event["type"] in (EVENT_TYPE_ARM, EVENT_TYPE_DISARM):
-                user_actions.append(self.__add_time_and_name(event))
+        for event in source_events:
+            parsed = {**event.as_dict(), "event_time": event.event_time}
+            if event.type == EVENT_TYPE_ALARM:
+                alarms.append(parsed)
+            elif event.type in (EVENT_TYPE_ARM, EVENT_TYPE_DISARM):
+                parsed["name"] = event.name
+                user_actions.append(parsed)
             else:
-                events.append(self.__add_time(event))
+                events.append(parsed)
 
         return {
-            ATTR_EVENTS: events,
-            ATTR_ALARMS: alarms,
-            ATTR_USER_ACTIONS: user_actions,
+            ATTR_EVENTS: tuple(events),
+            ATTR_ALARMS: tuple(alarms),
+            ATTR_USER_ACTIONS: tuple(user_actions),
         }
-
-    @property
-    def icon(self):
-        return "mdi:calendar"
-
-    def __add_time_and_name(self, event):
-        new_event = event.copy()
-        message = new_event.get("message", "")
-        name = message.split(" ")[0] if message else ""
-        new_event.update({"name": name})
-        return self.__add_time(new_event)
-
-    def __add_time(self, event):
-        new_event = event.copy()
-        device_time = new_event.get("deviceTime", [])
-        year = self.__safe_list_get(device_time, 0, 2000)
-        month = self.__safe_list_get(device_time, 1, 1)
-        day = self.__safe_list_get(device_time, 2, 1)
-        hour = self.__safe_list_get(device_time, 3, 0)
-        minutes = self.__safe_list_get(device_time, 4, 0)
-        seconds = self.__safe_list_get(device_time, 5, 0)
-        new_event["event_time"] = datetime(year, month, day, hour, minutes, seconds)
-        return new_event
-
-    @staticmethod
-    def __safe_list_get(current_list, idx, default):
-        try:
-            return current_list[idx]
-        except IndexError:
-            return default
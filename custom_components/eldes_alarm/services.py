@@ -0,0 +1,118 @@
+"""Services for Eldes."""
+import asyncio
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_STATE
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import ALARM_MODES, DATA_ENTITIES, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_ARM_PARTITIONS = "arm_partitions"
+SERVICE_SET_OUTPUTS = "set_outputs"
+
+ATTR_MODE = "mode"
+
+SERVICE_ALARM_MODES = {
+    "disarm": ALARM_MODES["DISARM"],
+    "arm_away": ALARM_MODES["ARM_AWAY"],
+    "arm_home": ALARM_MODES["ARM_HOME"],
+}
+
+ARM_PARTITIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_MODE): vol.In(SERVICE_ALARM_MODES),
+    }
+)
+
+SET_OUTPUTS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_STATE): cv.boolean,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant):
+    """Register the bulk command services."""
+
+    async def async_arm_partitions(call: ServiceCall) -> ServiceResponse:
+        # Imported here, the platform module imports the integration package this module is part of
+        from .alarm_control_panel import async_set_alarm_mode
+
+        mode = SERVICE_ALARM_MODES[call.data[ATTR_MODE]]
+        # Panels show the transition and are confirmed with one partition poll per device
+        return await _async_send_commands(
+            hass,
+            call.data[ATTR_ENTITY_ID],
+            "partitions",
+            lambda entities: async_set_alarm_mode(entities, mode),
+            refresh=False,
+        )
+
+    async def async_set_outputs(call: ServiceCall) -> ServiceResponse:
+        state = call.data[ATTR_STATE]
+        return await _async_send_commands(
+            hass,
+            call.data[ATTR_ENTITY_ID],
+            "outputs",
+            lambda entities: asyncio.gather(
+                *(entity.client.set_output(entity.imei, entity.entity_key, state) for entity in entities),
+                return_exceptions=True,
+            ),
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ARM_PARTITIONS,
+        async_arm_partitions,
+        schema=ARM_PARTITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_OUTPUTS,
+        async_set_outputs,
+        schema=SET_OUTPUTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_send_commands(hass: HomeAssistant, entity_ids, section, send, refresh=True) -> ServiceResponse:
+    """Send the commands for all targets at once and optionally refresh each involved coordinator once.
+
+    send gets the target entities and returns one exception, or any other value on success, per entity.
+    """
+    registered = hass.data.get(DOMAIN, {}).get(DATA_ENTITIES, {})
+    results = {}
+    entities = {}
+
+    for entity_id in entity_ids:
+        entity = registered.get(entity_id)
+        if entity is None or entity.section != section:
+            results[entity_id] = {"success": False, "error": f"Not an Eldes {section} entity"}
+        else:
+            entities[entity_id] = entity
+
+    # Concurrency is bounded by each account's request scheduler
+    outcomes = await send(list(entities.values())) if entities else []
+
+    for entity_id, outcome in zip(entities, outcomes):
+        if isinstance(outcome, Exception):
+            _LOGGER.error("Eldes command for %s failed: %s", entity_id, outcome)
+            results[entity_id] = {"success": False, "error": str(outcome)}
+        else:
+            results[entity_id] = {"success": True}
+
+    if refresh:
+        coordinators = {id(entity.coordinator): entity.coordinator for entity in entities.values()}
+        for coordinator in coordinators.values():
+            await coordinator.async_request_refresh()
+
+    return {"results": results}
@@ -0,0 +1,68 @@
+"""Persisted snapshot of the last Eldes device data, used to start without waiting for the cloud."""
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_KEY_SNAPSHOT, STORAGE_VERSION
+from .core.models import (
+    EldesDeviceInfo,
+    EldesEvent,
+    EldesOutput,
+    EldesPartition,
+    EldesTemperature,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+INDEXED_SECTIONS = {
+    "partitions": (EldesPartition, "internal_id"),
+    "outputs": (EldesOutput, "id"),
+    "temp": (EldesTemperature, "sensor_id"),
+}
+
+
+def get_snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_SNAPSHOT}.{entry.entry_id}")
+
+
+async def async_load_snapshot(store: Store) -> list | None:
+    """Load the stored devices, or None if there is no usable snapshot."""
+    try:
+        stored = await store.async_load()
+        if not stored:
+            return None
+        return [_deserialize_device(device) for device in stored["devices"]]
+    except Exception as ex:
+        _LOGGER.warning("Ignoring unreadable Eldes snapshot: %s", ex)
+        return None
+
+
+def serialize_devices(devices: list) -> dict:
+    return {"devices": [_serialize_device(device) for device in devices]}
+
+
+def _serialize_device(device: dict) -> dict:
+    data = {
+        "imei": device["imei"],
+        "info": device["info"].as_dict(),
+        "events": [event.as_dict() for event in device["events"]],
+    }
+    for section in INDEXED_SECTIONS:
+        data[section] = [item.as_dict() for item in device[section].values()]
+    return data
+
+
+def _deserialize_device(data: dict) -> dict:
+    device = {
+        "imei": data["imei"],
+        "info": EldesDeviceInfo.from_dict(data["info"]),
+        "events": [EldesEvent.from_dict(event) for event in data["events"]],
+        "failed_since": {},
+        "stale": set(),
+    }
+    for section, (model, key) in INDEXED_SECTIONS.items():
+        items = (model.from_dict(item) for item in data[section])
+        device[section] = {getattr(item, key): item for item in items}
+    return device
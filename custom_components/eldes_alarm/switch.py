@@ -1,5 +1,6 @@
 """Support for Eldes switches."""
 import logging
+from dataclasses import replace
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
@@ -25,8 +26,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entities = []
 
     for device_index in range(len(coordinator.data)):
-        for output_index in range(len(coordinator.data[device_index]["outputs"])):
-            entities.append(EldesSwitch(client, coordinator, device_index, output_index))
+        for output_id in coordinator.data[device_index]["outputs"]:
+            entities.append(EldesSwitch(client, coordinator, device_index, output_id))
 
     async_add_entities(entities)
 
@@ -34,49 +35,73 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 class EldesSwitch(EldesDeviceEntity, SwitchEntity):
     """Representation of an Eldes output switch."""
 
+    section = "outputs"
+
+    def __init__(self, client, coordinator, device_index, output_id):
+        super().__init__(client, coordinator, device_index, output_id)
+        self._pending_commands = 0
+        self._desired_state = None
+
     @property
     def output(self):
-        return self.data["outputs"][self.entity_index]
+        return self.item
+
+    @property
+    def data_slice(self):
+        return self.output, self._desired_state
 
     @property
     def unique_id(self):
-        return f"{self.imei}_output_{self.output['id']}"
+        return f"{self.imei}_output_{self.output.id}"
 
     @property
     def name(self):
-        return self.output["name"]
+        return self.output.name
 
     @property
     def is_on(self):
-        return self.output.get("outputState", False)
+        # Polls during the coalescing window still report the old state, so trust the command until it is sent
+        if self._pending_commands:
+            return self._desired_state
+        return self.output.output_state
 
     @property
     def extra_state_attributes(self):
         return {
-            "hasFault": self.output["hasFault"],
-            "outputState": self.output["outputState"],
-            "type": self.output["type"]
+            "hasFault": self.output.has_fault,
+            "outputState": self.output.output_state,
+            "type": self.output.type
         }
 
     @property
     def icon(self):
-        icon_name = self.output.get("iconName", DEFAULT_OUTPUT_ICON)
+        icon_name = self.output.icon_name or DEFAULT_OUTPUT_ICON
         return OUTPUT_ICONS_MAP.get(icon_name, OUTPUT_ICONS_MAP[DEFAULT_OUTPUT_ICON])
 
-    async def async_turn_on(self):
-        await self.client.turn_on_output(
-            self.imei,
-            self.output["id"]
-        )
-
-        self.output["outputState"] = True
+    async def _async_switch(self, output_state):
+        # Show the desired state right away; rapid toggles are coalesced into one request by the client
+        self._pending_commands += 1
+        self._desired_state = output_state
         self.async_write_ha_state()
 
-    async def async_turn_off(self):
-        await self.client.turn_off_output(
-            self.imei,
-            self.output["id"]
-        )
+        try:
+            await self.client.set_output(self.imei, self.output.id, output_state)
+        except Exception as ex:
+            _LOGGER.error("Failed to switch output %s: %s", self.name, ex)
+            raise
+        else:
+            if self._pending_commands == 1:
+                # The last command was sent, keep its state until the next poll confirms it
+                self.data["outputs"][self.entity_key] = replace(self.output, output_state=output_state)
+        finally:
+            self._pending_commands -= 1
+            if not self._pending_commands:
+                # On failure this falls back to the latest polled state
+                self._desired_state = None
+            self.async_write_ha_state()
 
-        self.output["outputState"] = False
-        self.async_write_ha_state()
+    async def async_turn_on(self):
+        await self._async_switch(True)
+
+    async def async_turn_off(self):
+        await self._async_switch(False)